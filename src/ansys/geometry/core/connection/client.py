@@ -21,12 +21,15 @@
 # SOFTWARE.
 """Module providing a wrapped abstraction of the gRPC PROTO API definition and stubs."""
 
+from functools import cached_property
 import logging
 from pathlib import Path
 import time
 
 from ansys.api.dbu.v0.admin_pb2 import BackendType as GRPCBackendType
 from ansys.api.dbu.v0.admin_pb2_grpc import AdminStub
+from ansys.api.geometry.v0.edges_pb2_grpc import EdgesStub
+from ansys.api.geometry.v0.faces_pb2_grpc import FacesStub
 from beartype import beartype as check_input_types
 from beartype.typing import Optional, Union
 from google.protobuf.empty_pb2 import Empty
@@ -139,6 +142,9 @@ class GrpcClient:
     ):
         """Initialize the ``GrpcClient`` object."""
         self._closed = False
+        # Increased by server-side operations that may modify any body, so that
+        # the data cached by the faces is requested again
+        self._topology_version = 0
         self._remote_instance = remote_instance
         self._local_instance = local_instance
         self._product_instance = product_instance
@@ -204,6 +210,16 @@ class GrpcClient:
         """Client gRPC channel."""
         return self._channel
 
+    @cached_property
+    def _faces_stub(self) -> FacesStub:
+        """Faces stub shared by all faces handled by the client."""
+        return FacesStub(self._channel)
+
+    @cached_property
+    def _edges_stub(self) -> EdgesStub:
+        """Edges stub shared by all faces and edges handled by the client."""
+        return EdgesStub(self._channel)
+
     @property
     def log(self) -> PyGeometryCustomAdapter:
         """Specific instance logger."""
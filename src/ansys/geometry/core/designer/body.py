@@ -23,6 +23,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum, unique
 from functools import wraps
+from weakref import WeakValueDictionary
 
 from ansys.api.dbu.v0.dbumodels_pb2 import EntityIdentifier
 from ansys.api.geometry.v0.bodies_pb2 import (
@@ -49,7 +50,7 @@ from ansys.geometry.core.connection.conversions import (
     tess_to_pd,
     unit_vector_to_grpc_direction,
 )
-from ansys.geometry.core.designer.edge import CurveType, Edge
+from ansys.geometry.core.designer.edge import _CURVE_TYPES, CurveType, Edge
 from ansys.geometry.core.designer.face import Face, SurfaceType
 from ansys.geometry.core.errors import protect_grpc
 from ansys.geometry.core.materials.material import Material
@@ -86,6 +87,10 @@ class IBody(ABC):
     class. All child classes must implement all abstract methods.
     """
 
+    def __init__(self):
+        """Initialize the ``IBody`` class."""
+        self._edges_cache = WeakValueDictionary()
+
     @abstractmethod
     def id(self) -> str:
         """Get the ID of the body as a string."""
@@ -509,6 +514,35 @@ class IBody(ABC):
         """
         return
 
+    def _intern_edge(self, id: str, curve_type: CurveType, grpc_client: GrpcClient) -> Edge:
+        """
+        Get the ``Edge`` object of this body with a given ID.
+
+        Notes
+        -----
+        The same ``Edge`` object is returned for a given ID while it is still
+        referenced, instead of creating a new one on each request.
+
+        Parameters
+        ----------
+        id : str
+            Server-defined ID for the edge.
+        curve_type : CurveType
+            Type of curve that the edge forms.
+        grpc_client : GrpcClient
+            Active supporting Geometry service instance for design modeling.
+
+        Returns
+        -------
+        Edge
+            Edge of this body with the given ID.
+        """
+        edge = self._edges_cache.get(id)
+        if edge is None or edge.curve_type != curve_type:
+            edge = Edge(id, curve_type, self, grpc_client)
+            self._edges_cache[id] = edge
+        return edge
+
 
 class MasterBody(IBody):
     """
@@ -540,6 +574,7 @@ class MasterBody(IBody):
         is_surface: bool = False,
     ):
         """Initialize the ``MasterBody`` class."""
+        super().__init__()
         check_type(id, str)
         check_type(name, str)
         check_type(grpc_client, GrpcClient)
@@ -555,6 +590,7 @@ class MasterBody(IBody):
         self._bodies_stub = BodiesStub(self._grpc_client.channel)
         self._commands_stub = CommandsStub(self._grpc_client.channel)
         self._tessellation = None
+        self._topology_version = 0
 
     def reset_tessellation_cache(func):
         """
@@ -574,7 +610,11 @@ class MasterBody(IBody):
         @wraps(func)
         def wrapper(self: "MasterBody", *args, **kwargs):
             self._tessellation = None
-            return func(self, *args, **kwargs)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                # Outdate the server-side data cached by the faces of the body
+                self._topology_version += 1
 
         return wrapper
 
@@ -619,7 +659,7 @@ class MasterBody(IBody):
         self._grpc_client.log.debug(f"Retrieving edges for body {self.id} from server.")
         grpc_edges = self._bodies_stub.GetEdges(self._grpc_id)
         return [
-            Edge(grpc_edge.id, CurveType(grpc_edge.curve_type), self, self._grpc_client)
+            self._intern_edge(grpc_edge.id, _CURVE_TYPES[grpc_edge.curve_type], self._grpc_client)
             for grpc_edge in grpc_edges.edges
         ]
 
@@ -854,6 +894,7 @@ class Body(IBody):
 
     def __init__(self, id, name, parent: "Component", template: MasterBody) -> None:
         """Initialize the ``Body`` class."""
+        super().__init__()
         self._id = id
         self._name = name
         self._parent = parent
@@ -877,7 +918,11 @@ class Body(IBody):
         @wraps(func)
         def wrapper(self: "Body", *args, **kwargs):
             self._template._tessellation = None
-            return func(self, *args, **kwargs)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                # Outdate the server-side data cached by the faces of the body
+                self._template._topology_version += 1
 
         return wrapper
 
@@ -914,7 +959,9 @@ class Body(IBody):
         self._template._grpc_client.log.debug(f"Retrieving edges for body {self.id} from server.")
         grpc_edges = self._template._bodies_stub.GetEdges(EntityIdentifier(id=self.id))
         return [
-            Edge(grpc_edge.id, CurveType(grpc_edge.curve_type), self, self._template._grpc_client)
+            self._intern_edge(
+                grpc_edge.id, _CURVE_TYPES[grpc_edge.curve_type], self._template._grpc_client
+            )
             for grpc_edge in grpc_edges.edges
         ]
 
@@ -926,6 +973,15 @@ class Body(IBody):
     def _is_alive(self, value: bool):
         self._template._is_alive = value
 
+    @property
+    def _topology_version(self) -> int:  # noqa: D102
+        return self._template._topology_version
+
+    def _outdate_cache(self) -> None:
+        """Discard the data cached on the client after the body is modified on the server."""
+        self._template._tessellation = None
+        self._template._topology_version += 1
+
     @property
     def is_alive(self) -> bool:  # noqa: D102
         return self._is_alive
@@ -971,6 +1027,7 @@ class Body(IBody):
     def add_midsurface_offset(self, offset: "MidSurfaceOffsetType") -> None:  # noqa: D102
         self._template.add_midsurface_offset(offset)
 
+    @reset_tessellation_cache
     def imprint_curves(
         self, faces: List[Face], sketch: Sketch
     ) -> Tuple[List[Edge], List[Face]]:  # noqa: D102
@@ -999,7 +1056,9 @@ class Body(IBody):
         )
 
         new_edges = [
-            Edge(grpc_edge.id, grpc_edge.curve_type, self, self._template._grpc_client)
+            self._intern_edge(
+                grpc_edge.id, _CURVE_TYPES[grpc_edge.curve_type], self._template._grpc_client
+            )
             for grpc_edge in imprint_response.edges
         ]
 
@@ -1040,6 +1099,7 @@ class Body(IBody):
 
     @check_input_types
     @protect_grpc
+    @reset_tessellation_cache
     def imprint_projected_curves(
         self,
         direction: UnitVector3D,
@@ -319,15 +319,19 @@ class Component:
         )
         angle = rotation_angle if isinstance(rotation_angle, Angle) else Angle(rotation_angle)
 
-        response = self._component_stub.SetPlacement(
-            SetPlacementRequest(
-                id=self.id,
-                translation=t,
-                rotation_axis_origin=p,
-                rotation_axis_direction=d,
-                rotation_angle=angle.value.m,
+        try:
+            response = self._component_stub.SetPlacement(
+                SetPlacementRequest(
+                    id=self.id,
+                    translation=t,
+                    rotation_axis_origin=p,
+                    rotation_axis_direction=d,
+                    rotation_angle=angle.value.m,
+                )
             )
-        )
+        finally:
+            # Moving the component moves all the bodies underneath it
+            self._grpc_client._topology_version += 1
         self._master_component.transform = grpc_matrix_to_matrix(response.matrix)
 
     def reset_placement(self):
@@ -392,9 +396,12 @@ class Component:
         self._grpc_client.log.debug(
             f"Setting shared topology type {share_type.value} on {self.id}."
         )
-        self._component_stub.SetSharedTopology(
-            SetSharedTopologyRequest(id=self.id, share_type=share_type.value)
-        )
+        try:
+            self._component_stub.SetSharedTopology(
+                SetSharedTopologyRequest(id=self.id, share_type=share_type.value)
+            )
+        finally:
+            self._grpc_client._topology_version += 1
 
         # Store the SharedTopologyType set on the client
         self._shared_topology = share_type
@@ -615,12 +622,12 @@ class Component:
         -------
         None
         """
-        body_ids_found = []
+        bodies_found = []
 
         for body in bodies:
             body_requested = self.search_body(body.id)
             if body_requested:
-                body_ids_found.append(body_requested.id)
+                bodies_found.append(body_requested)
             else:
                 self._grpc_client.log.warning(
                     f"Body with ID {body.id} and name {body.name} is not found in this "
@@ -628,18 +635,24 @@ class Component:
                 )
                 pass
 
+        body_ids_found = [body.id for body in bodies_found]
         distance = distance if isinstance(distance, Distance) else Distance(distance)
 
         translation_magnitude = distance.value.m_as(DEFAULT_UNITS.SERVER_LENGTH)
 
         self._grpc_client.log.debug(f"Translating {body_ids_found}...")
-        self._bodies_stub.Translate(
-            TranslateRequest(
-                ids=body_ids_found,
-                direction=unit_vector_to_grpc_direction(direction),
-                distance=translation_magnitude,
+        try:
+            self._bodies_stub.Translate(
+                TranslateRequest(
+                    ids=body_ids_found,
+                    direction=unit_vector_to_grpc_direction(direction),
+                    distance=translation_magnitude,
+                )
             )
-        )
+        finally:
+            # Outdate the data cached for the translated bodies
+            for body in bodies_found:
+                body._outdate_cache()
 
     @protect_grpc
     @check_input_types
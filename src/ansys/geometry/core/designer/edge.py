@@ -24,7 +24,6 @@
 from enum import Enum, unique
 
 from ansys.api.dbu.v0.dbumodels_pb2 import EntityIdentifier
-from ansys.api.geometry.v0.edges_pb2_grpc import EdgesStub
 from beartype.typing import TYPE_CHECKING, List
 from pint import Quantity
 
@@ -50,6 +49,10 @@ class CurveType(Enum):
     CURVETYPE_PROCEDURAL = 5
 
 
+# Lookup table from server-side values to enum members, cheaper than calling the enum
+_CURVE_TYPES = {curve_type.value: curve_type for curve_type in CurveType}
+
+
 class Edge:
     """
     Represents a single edge of a body within the design assembly.
@@ -74,7 +77,7 @@ class Edge:
         self._curve_type = curve_type
         self._body = body
         self._grpc_client = grpc_client
-        self._edges_stub = EdgesStub(grpc_client.channel)
+        self._edges_stub = grpc_client._edges_stub
 
     @property
     def id(self) -> str:
@@ -21,18 +21,17 @@
 # SOFTWARE.
 """Module for managing a face."""
 
+from collections import deque
 from enum import Enum, unique
 
 from ansys.api.dbu.v0.dbumodels_pb2 import EntityIdentifier
-from ansys.api.geometry.v0.edges_pb2_grpc import EdgesStub
 from ansys.api.geometry.v0.faces_pb2 import EvaluateRequest, GetNormalRequest
-from ansys.api.geometry.v0.faces_pb2_grpc import FacesStub
 from ansys.api.geometry.v0.models_pb2 import Edge as GRPCEdge
-from beartype.typing import TYPE_CHECKING, List
+from beartype.typing import TYPE_CHECKING, List, Tuple
 from pint import Quantity
 
 from ansys.geometry.core.connection.client import GrpcClient
-from ansys.geometry.core.designer.edge import CurveType, Edge
+from ansys.geometry.core.designer.edge import _CURVE_TYPES, Edge
 from ansys.geometry.core.errors import protect_grpc
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D
@@ -64,6 +63,13 @@ class FaceLoopType(Enum):
     OUTER_LOOP = "OUTER"
 
 
+# Lookup table from server-side values to enum members, cheaper than calling the enum
+_FACE_LOOP_TYPES = {loop_type.value: loop_type for loop_type in FaceLoopType}
+
+# Maximum number of evaluation requests awaiting a response at any time
+_MAX_IN_FLIGHT_EVALUATIONS = 256
+
+
 class FaceLoop:
     """
     Provides an internal class holding the face loops defined on the server side.
@@ -149,11 +155,13 @@ class Face:
     def __init__(self, id: str, surface_type: SurfaceType, body: "Body", grpc_client: GrpcClient):
         """Initialize ``Face`` class."""
         self._id = id
+        self._grpc_id_msg = EntityIdentifier(id=id)
         self._surface_type = surface_type
         self._body = body
         self._grpc_client = grpc_client
-        self._faces_stub = FacesStub(grpc_client.channel)
-        self._edges_stub = EdgesStub(grpc_client.channel)
+        self._faces_stub = grpc_client._faces_stub
+        self._edges_stub = grpc_client._edges_stub
+        self._invalidate()
 
     @property
     def id(self) -> str:
@@ -163,7 +171,7 @@ class Face:
     @property
     def _grpc_id(self) -> EntityIdentifier:
         """Entity identifier of this face on the server side."""
-        return EntityIdentifier(id=self._id)
+        return self._grpc_id_msg
 
     @property
     def body(self) -> "Body":
@@ -171,12 +179,32 @@ class Face:
         return self._body
 
     @property
-    @protect_grpc
     def area(self) -> Quantity:
         """Calculated area of the face."""
-        self._grpc_client.log.debug("Requesting face area from server.")
-        area_response = self._faces_stub.GetArea(self._grpc_id)
-        return Quantity(area_response.area, DEFAULT_UNITS.SERVER_AREA)
+        return self._get_area()
+
+    @protect_grpc
+    def _get_area(self, cache: bool = True) -> Quantity:
+        """
+        Get the area of the face.
+
+        Parameters
+        ----------
+        cache : bool, default: True
+            Whether to reuse the area previously retrieved from the server.
+            If ``False``, the area is requested again.
+
+        Returns
+        -------
+        Quantity
+            Calculated area of the face.
+        """
+        self.__check_cache_version()
+        if not cache or self._cache_area is None:
+            self._grpc_client.log.debug("Requesting face area from server.")
+            area_response = self._faces_stub.GetArea(self._grpc_id)
+            self._cache_area = Quantity(area_response.area, DEFAULT_UNITS.SERVER_AREA)
+        return self._cache_area
 
     @property
     def surface_type(self) -> SurfaceType:
@@ -184,48 +212,87 @@ class Face:
         return self._surface_type
 
     @property
-    @protect_grpc
     def edges(self) -> List[Edge]:
         """List of all edges of the face."""
-        self._grpc_client.log.debug("Requesting face edges from server.")
-        edges_response = self._faces_stub.GetEdges(self._grpc_id)
-        return self.__grpc_edges_to_edges(edges_response.edges)
+        return self._get_edges()
 
-    @property
     @protect_grpc
+    def _get_edges(self, cache: bool = True) -> List[Edge]:
+        """
+        Get the edges of the face.
+
+        Parameters
+        ----------
+        cache : bool, default: True
+            Whether to reuse the edges previously retrieved from the server.
+            If ``False``, the edges are requested again.
+
+        Returns
+        -------
+        List[Edge]
+            List of all edges of the face.
+        """
+        self.__check_cache_version()
+        if not cache or self._cache_edges is None:
+            self._grpc_client.log.debug("Requesting face edges from server.")
+            edges_response = self._faces_stub.GetEdges(self._grpc_id)
+            self._cache_edges = self.__grpc_edges_to_edges(edges_response.edges)
+        return list(self._cache_edges)
+
+    @property
     def loops(self) -> List[FaceLoop]:
         """List of all loops of the face."""
+        return self._get_loops()
+
+    @protect_grpc
+    def _get_loops(self, cache: bool = True) -> List[FaceLoop]:
+        """
+        Get the loops of the face.
+
+        Parameters
+        ----------
+        cache : bool, default: True
+            Whether to reuse the loops previously retrieved from the server.
+            If ``False``, the loops are requested again.
+
+        Returns
+        -------
+        List[FaceLoop]
+            List of all loops of the face.
+        """
+        self.__check_cache_version()
+        if cache and self._cache_loops is not None:
+            return list(self._cache_loops)
+
         self._grpc_client.log.debug("Requesting face loops from server.")
-        grpc_loops = self._faces_stub.GetLoops(EntityIdentifier(id=self.id)).loops
+        grpc_loops = self._faces_stub.GetLoops(self._grpc_id).loops
+
+        # Reuse the edges of the face, instead of one request per loop edge
+        edges_by_id = {edge.id: edge for edge in self._get_edges(cache)}
+
+        server_length = DEFAULT_UNITS.SERVER_LENGTH
         loops = []
         for grpc_loop in grpc_loops:
-            type = FaceLoopType(grpc_loop.type)
-            length = Quantity(grpc_loop.length, DEFAULT_UNITS.SERVER_LENGTH)
-            min = Point3D(
-                [
-                    grpc_loop.bounding_box.min.x,
-                    grpc_loop.bounding_box.min.y,
-                    grpc_loop.bounding_box.min.z,
-                ],
-                DEFAULT_UNITS.SERVER_LENGTH,
-            )
-            max = Point3D(
-                [
-                    grpc_loop.bounding_box.max.x,
-                    grpc_loop.bounding_box.max.y,
-                    grpc_loop.bounding_box.max.z,
-                ],
-                DEFAULT_UNITS.SERVER_LENGTH,
-            )
-            grpc_edges = [
-                self._edges_stub.Get(EntityIdentifier(id=edge_id)) for edge_id in grpc_loop.edges
+            type = _FACE_LOOP_TYPES[grpc_loop.type]
+            length = Quantity(grpc_loop.length, server_length)
+            bounding_box = grpc_loop.bounding_box
+            bbox_min, bbox_max = bounding_box.min, bounding_box.max
+            min = Point3D([bbox_min.x, bbox_min.y, bbox_min.z], server_length)
+            max = Point3D([bbox_max.x, bbox_max.y, bbox_max.z], server_length)
+            missing_grpc_edges = [
+                self._edges_stub.Get(EntityIdentifier(id=edge_id))
+                for edge_id in grpc_loop.edges
+                if edge_id not in edges_by_id
             ]
-            edges = self.__grpc_edges_to_edges(grpc_edges)
+            for edge in self.__grpc_edges_to_edges(missing_grpc_edges):
+                edges_by_id[edge.id] = edge
+            edges = [edges_by_id[edge_id] for edge_id in grpc_loop.edges]
             loops.append(
                 FaceLoop(type=type, length=length, min_bbox=min, max_bbox=max, edges=edges)
             )
 
-        return loops
+        self._cache_loops = loops
+        return list(loops)
 
     @protect_grpc
     def face_normal(self, u: float = 0.5, v: float = 0.5) -> UnitVector3D:
@@ -288,6 +355,122 @@ class Face:
         response = self._faces_stub.Evaluate(EvaluateRequest(id=self.id, u=u, v=v)).point
         return Point3D([response.x, response.y, response.z], DEFAULT_UNITS.SERVER_LENGTH)
 
+    @protect_grpc
+    def face_normals(self, uvs: List[Tuple[float, float]]) -> List[UnitVector3D]:
+        """
+        Get the normal directions to the face evaluated at several UV coordinates.
+
+        Notes
+        -----
+        Up to 256 requests are kept in flight instead of waiting for each
+        evaluation before requesting the next one. The same considerations on UV
+        coordinates as for the ``face_normal()`` method apply.
+
+        Parameters
+        ----------
+        uvs : List[Tuple[float, float]]
+            UV coordinates, as ``(u, v)`` pairs, to evaluate the normals at.
+
+        Returns
+        -------
+        List[UnitVector3D]
+            :class:`UnitVector3D` objects evaluated at the given UV coordinates,
+            in the same order.
+        """
+        self._grpc_client.log.debug(f"Requesting {len(uvs)} face normals from server.")
+        responses = self.__evaluate_windowed(
+            self._faces_stub.GetNormal, (GetNormalRequest(id=self.id, u=u, v=v) for u, v in uvs)
+        )
+        return [
+            UnitVector3D([resp.direction.x, resp.direction.y, resp.direction.z])
+            for resp in responses
+        ]
+
+    @protect_grpc
+    def face_points(self, uvs: List[Tuple[float, float]]) -> List[Point3D]:
+        """
+        Get points of the face evaluated at several UV coordinates.
+
+        Notes
+        -----
+        Up to 256 requests are kept in flight instead of waiting for each
+        evaluation before requesting the next one. The same considerations on UV
+        coordinates as for the ``face_point()`` method apply.
+
+        Parameters
+        ----------
+        uvs : List[Tuple[float, float]]
+            UV coordinates, as ``(u, v)`` pairs, to evaluate the points at.
+
+        Returns
+        -------
+        List[Point3D]
+            :class:`Point3D` objects evaluated at the given UV coordinates,
+            in the same order.
+        """
+        self._grpc_client.log.debug(f"Requesting {len(uvs)} face points from server.")
+        responses = self.__evaluate_windowed(
+            self._faces_stub.Evaluate, (EvaluateRequest(id=self.id, u=u, v=v) for u, v in uvs)
+        )
+        return [
+            Point3D([resp.point.x, resp.point.y, resp.point.z], DEFAULT_UNITS.SERVER_LENGTH)
+            for resp in responses
+        ]
+
+    def __evaluate_windowed(self, method, requests) -> list:
+        """
+        Send evaluation requests with a bounded number of them in flight.
+
+        Parameters
+        ----------
+        method : grpc.UnaryUnaryMultiCallable
+            Stub method to call for each request.
+        requests : Iterable
+            Requests to send.
+
+        Returns
+        -------
+        list
+            Responses to the requests, in the same order.
+        """
+        responses = []
+        pending = deque()
+        try:
+            for request in requests:
+                if len(pending) == _MAX_IN_FLIGHT_EVALUATIONS:
+                    responses.append(pending.popleft().result())
+                pending.append(method.future(request))
+            while pending:
+                responses.append(pending.popleft().result())
+        finally:
+            # Only left with pending requests if one of them failed
+            for future in pending:
+                future.cancel()
+        return responses
+
+    def _invalidate(self) -> None:
+        """
+        Discard the server-side data cached by the face.
+
+        Notes
+        -----
+        The cache is also discarded automatically whenever the parent body
+        is modified.
+        """
+        self._cache_area = None
+        self._cache_edges = None
+        self._cache_loops = None
+        self._cache_version = self.__topology_version()
+
+    def __check_cache_version(self) -> None:
+        """Discard the cached data if the parent body was modified after caching it."""
+        if self._cache_version != self.__topology_version():
+            self._invalidate()
+
+    def __topology_version(self) -> Tuple[int, int]:
+        """Get the versions of the parent body and of the client, as the cache key."""
+        return (self._body._topology_version, self._grpc_client._topology_version)
+
     def __grpc_edges_to_edges(self, edges_grpc: List[GRPCEdge]) -> List[Edge]:
         """
         Transform a list of gRPC edge messages into actual ``Edge`` objects.
@@ -302,9 +485,9 @@ class Face:
         List[Edge]
             ``Edge`` objects to obtain from gRPC messages.
         """
-        edges = []
-        for edge_grpc in edges_grpc:
-            edges.append(
-                Edge(edge_grpc.id, CurveType(edge_grpc.curve_type), self._body, self._grpc_client)
+        return [
+            self._body._intern_edge(
+                edge_grpc.id, _CURVE_TYPES[edge_grpc.curve_type], self._grpc_client
             )
-        return edges
+            for edge_grpc in edges_grpc
+        ]
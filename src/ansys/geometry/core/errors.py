@@ -31,6 +31,9 @@ from ansys.geometry.core.logger import LOG as logger
 
 SIGINT_TRACKER = []
 
+# Whether a protected call is already capturing KeyboardInterrupt on the main thread
+_CAPTURING_INTERRUPT = False
+
 
 class GeometryRuntimeError(RuntimeError):
     """Provides error message to raise when Geometry service passes a runtime error."""
@@ -88,11 +91,18 @@ def protect_grpc(func):
         KeyboardInterrupt
             If a KeyboardInterrupt error is observed.
         """
-        # capture KeyboardInterrupt
-        old_handler = None
-        if threading.current_thread().__class__.__name__ == "_MainThread":
-            if threading.current_thread().is_alive():
-                old_handler = signal.signal(signal.SIGINT, handler)
+        global _CAPTURING_INTERRUPT
+
+        # capture KeyboardInterrupt, unless an outer protected call is already doing so
+        main_thread = threading.main_thread()
+        capture_interrupt = (
+            not _CAPTURING_INTERRUPT
+            and threading.current_thread() is main_thread
+            and main_thread.is_alive()
+        )
+        if capture_interrupt:
+            old_handler = signal.signal(signal.SIGINT, handler)
+            _CAPTURING_INTERRUPT = True
 
         # Capture gRPC exceptions
         try:
@@ -101,17 +111,18 @@ def protect_grpc(func):
             raise GeometryExitedError(
                 f"Geometry service connection terminated: {error.details()}"
             ) from None
-
-        if threading.current_thread().__class__.__name__ == "_MainThread":
-            received_interrupt = bool(SIGINT_TRACKER)
-
-            # always clear and revert to old handler
-            SIGINT_TRACKER.clear()
-            if old_handler:
-                signal.signal(signal.SIGINT, old_handler)
-
-            if received_interrupt:  # pragma: no cover
-                raise KeyboardInterrupt("Interrupted during Geometry service execution")
+        finally:
+            if capture_interrupt:
+                received_interrupt = bool(SIGINT_TRACKER)
+
+                # always clear and revert to old handler
+                SIGINT_TRACKER.clear()
+                if old_handler:
+                    signal.signal(signal.SIGINT, old_handler)
+                _CAPTURING_INTERRUPT = False
+
+        if capture_interrupt and received_interrupt:  # pragma: no cover
+            raise KeyboardInterrupt("Interrupted during Geometry service execution")
 
         return out
 
@@ -47,6 +47,15 @@ class Frame:
         Y-axis direction.
     """  # noqa : E501
 
+    __slots__ = (
+        "_origin",
+        "_direction_x",
+        "_direction_y",
+        "_direction_z",
+        "_rotation_matrix",
+        "_transformation_matrix",
+    )
+
     @check_input_types
     def __init__(
         self,
@@ -72,38 +81,14 @@ class Frame:
         self._direction_z = UnitVector3D(self._direction_x % self._direction_y)
 
         self._rotation_matrix = Matrix33(
-            np.array(
-                [
-                    self.direction_x.tolist(),
-                    self.direction_y.tolist(),
-                    self.direction_z.tolist(),
-                ]
-            )
+            np.array([self._direction_x, self._direction_y, self._direction_z])
         )
 
-        self._transformation_matrix = Matrix44(
-            [
-                [
-                    self.direction_x.x,
-                    self.direction_y.x,
-                    self.direction_z.x,
-                    self.origin.x.to_base_units().m,
-                ],
-                [
-                    self.direction_x.y,
-                    self.direction_y.y,
-                    self.direction_z.y,
-                    self.origin.y.to_base_units().m,
-                ],
-                [
-                    self.direction_x.z,
-                    self.direction_y.z,
-                    self.direction_z.z,
-                    self.origin.z.to_base_units().m,
-                ],
-                [0, 0, 0, 1],
-            ]
-        )
+        # Point3D stores its values in base units, as the matrix expects
+        transformation_matrix = np.identity(4)
+        transformation_matrix[:3, :3] = self._rotation_matrix.T
+        transformation_matrix[:3, 3] = self._origin
+        self._transformation_matrix = Matrix44(transformation_matrix)
 
     @property
     def origin(self) -> Point3D:
@@ -182,7 +167,9 @@ class Frame:
         Point3D
             Global coordinates for the 3D point.
         """
-        return self.origin + Vector3D(self.local_to_global_rotation @ [point[0], point[1], 0])
+        # The first two columns of the transformation matrix hold the x and y axes
+        offset = np.dot(self._transformation_matrix[:3, :2], point).view(Vector3D)
+        return self.origin + offset
 
     @check_input_types
     def __eq__(self, other: "Frame") -> bool:
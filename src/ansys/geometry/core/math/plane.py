@@ -47,6 +47,8 @@ class Plane(Frame):
         Y-axis direction.
     """  # noqa : E501
 
+    __slots__ = ()
+
     def __init__(
         self,
         origin: Union[np.ndarray, RealSequence, Point3D] = ZERO_POINT3D,
@@ -81,9 +83,10 @@ class Plane(Frame):
         # If plane equation is equal to 0, your point is contained
         return True if np.isclose(plane_eq, 0.0) else False
 
-    @check_input_types
     def __eq__(self, other: "Plane") -> bool:
         """Equals operator for the ``Plane`` class."""
+        if not isinstance(other, Plane):
+            return NotImplemented
         return (
             self.origin == other.origin
             and self.direction_x == other.direction_x
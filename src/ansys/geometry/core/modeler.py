@@ -339,7 +339,11 @@ class Modeler:
         )
 
         self.client.log.debug(f"Running Discovery script file at {file_path}...")
-        response = ga_stub.RunScriptFile(request)
+        try:
+            response = ga_stub.RunScriptFile(request)
+        finally:
+            # The script may have modified any body
+            self.client._topology_version += 1
 
         if not response.success:
             raise GeometryRuntimeError(response.message)
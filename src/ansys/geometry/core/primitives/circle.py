@@ -27,7 +27,7 @@ from beartype.typing import Union
 import numpy as np
 from pint import Quantity
 
-from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z
+from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z, ZERO_POINT3D
 from ansys.geometry.core.math.matrix import Matrix44
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
@@ -112,7 +112,7 @@ class Circle:
         """X-direction of the circle."""
         return self._reference
 
-    @property
+    @cached_property
     def dir_y(self) -> UnitVector3D:
         """Y-direction of the circle."""
         return self.dir_z.cross(self.dir_x)
@@ -163,13 +163,13 @@ class Circle:
             New circle that is the transformed copy of the original circle.
         """
         new_point = self.origin.transform(matrix)
-        new_reference = self._reference.transform(matrix)
-        new_axis = self._axis.transform(matrix)
+        # Directions only pick up the rotational part of the matrix
+        new_reference, new_axis = np.dot([self._reference, self._axis], matrix[:3, :3].T)
         return Circle(
             new_point,
             self.radius,
-            UnitVector3D(new_reference[0:3]),
-            UnitVector3D(new_axis[0:3]),
+            UnitVector3D(new_reference),
+            UnitVector3D(new_axis),
         )
 
     def mirrored_copy(self) -> "Circle":
@@ -199,7 +199,7 @@ class Circle:
         """
         origin_to_point = point - self.origin
         dir_in_plane = UnitVector3D.from_points(
-            Point3D([0, 0, 0]), origin_to_point - ((origin_to_point * self.dir_z) * self.dir_z)
+            ZERO_POINT3D, origin_to_point - ((origin_to_point * self.dir_z) * self.dir_z)
         )
         if dir_in_plane.is_zero:
             return CircleEvaluation(self, 0)
@@ -22,13 +22,14 @@
 """Provides for creating and managing a cone."""
 
 from functools import cached_property
+import math
 
 from beartype import beartype as check_input_types
 from beartype.typing import Union
 import numpy as np
 from pint import Quantity
 
-from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z
+from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z, ZERO_VECTOR3D
 from ansys.geometry.core.math.matrix import Matrix44
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
@@ -107,7 +108,7 @@ class Cone:
         """X-direction of the cone."""
         return self._reference
 
-    @property
+    @cached_property
     def dir_y(self) -> UnitVector3D:
         """Y-direction of the cone."""
         return self.dir_z.cross(self.dir_x)
@@ -147,14 +148,14 @@ class Cone:
             New cone that is the transformed copy of the original cone.
         """
         new_point = self.origin.transform(matrix)
-        new_reference = self._reference.transform(matrix)
-        new_axis = self._axis.transform(matrix)
+        # Directions only pick up the rotational part of the matrix
+        new_reference, new_axis = np.dot([self._reference, self._axis], matrix[:3, :3].T)
         return Cone(
             new_point,
             self.radius,
             self.half_angle,
-            UnitVector3D(new_reference[0:3]),
-            UnitVector3D(new_axis[0:3]),
+            UnitVector3D(new_reference),
+            UnitVector3D(new_axis),
         )
 
     def mirrored_copy(self) -> "Cone":
@@ -263,7 +264,7 @@ class Cone:
         """
         # V parameter interval depends on which way the cone opens
         start, end = (
-            (self.apex_param, np.inf) if self.apex_param < 0 else (np.NINF, self.apex_param)
+            (self.apex_param, math.inf) if self.apex_param < 0 else (-math.inf, self.apex_param)
         )
         return Parameterization(ParamForm.OPEN, ParamType.LINEAR, Interval(start, end))
 
@@ -403,7 +404,7 @@ class ConeEvaluation(SurfaceEvaluation):
         Vector3D
             Second derivative with respect to the V parameter.
         """
-        return Vector3D([0, 0, 0])
+        return ZERO_VECTOR3D
 
     @cached_property
     def min_curvature(self) -> Real:
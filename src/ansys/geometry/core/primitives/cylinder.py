@@ -22,13 +22,14 @@
 """Provides for creating and managing a cylinder."""
 
 from functools import cached_property
+import math
 
 from beartype import beartype as check_input_types
 from beartype.typing import Union
 import numpy as np
 import pint
 
-from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z
+from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z, ZERO_VECTOR3D
 from ansys.geometry.core.math.matrix import Matrix44
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
@@ -99,7 +100,7 @@ class Cylinder:
         """X-direction of the cylinder."""
         return self._reference
 
-    @property
+    @cached_property
     def dir_y(self) -> UnitVector3D:
         """Y-direction of the cylinder."""
         return self.dir_z.cross(self.dir_x)
@@ -178,13 +179,13 @@ class Cylinder:
             New cylinder that is the transformed copy of the original cylinder.
         """
         new_point = self.origin.transform(matrix)
-        new_reference = self._reference.transform(matrix)
-        new_axis = self._axis.transform(matrix)
+        # Directions only pick up the rotational part of the matrix
+        new_reference, new_axis = np.dot([self._reference, self._axis], matrix[:3, :3].T)
         return Cylinder(
             new_point,
             self.radius,
-            UnitVector3D(new_reference[0:3]),
-            UnitVector3D(new_axis[0:3]),
+            UnitVector3D(new_reference),
+            UnitVector3D(new_axis),
         )
 
     def mirrored_copy(self) -> "Cylinder":
@@ -272,7 +273,7 @@ class Cylinder:
         Parameterization
             Information about how the cylinders's V parameter is parameterized.
         """
-        return Parameterization(ParamForm.OPEN, ParamType.LINEAR, Interval(np.NINF, np.inf))
+        return Parameterization(ParamForm.OPEN, ParamType.LINEAR, Interval(-math.inf, math.inf))
 
 
 class CylinderEvaluation(SurfaceEvaluation):
@@ -399,7 +400,7 @@ class CylinderEvaluation(SurfaceEvaluation):
         Vector3D
             Second derivative with respect to the U and v parameters.
         """
-        return Vector3D([0, 0, 0])
+        return ZERO_VECTOR3D
 
     @cached_property
     def vv_derivative(self) -> Vector3D:
@@ -411,7 +412,7 @@ class CylinderEvaluation(SurfaceEvaluation):
         Vector3D
             Second derivative with respect to the V parameter.
         """
-        return Vector3D([0, 0, 0])
+        return ZERO_VECTOR3D
 
     @cached_property
     def min_curvature(self) -> Real:
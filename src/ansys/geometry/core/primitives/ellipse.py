@@ -29,7 +29,7 @@ import numpy as np
 from pint import Quantity
 from scipy.integrate import quad
 
-from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z
+from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z, ZERO_POINT3D
 from ansys.geometry.core.math.matrix import Matrix44
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
@@ -125,7 +125,7 @@ class Ellipse:
         """X-direction of the ellipse."""
         return self._reference
 
-    @property
+    @cached_property
     def dir_y(self) -> UnitVector3D:
         """Y-direction of the ellipse."""
         return self.dir_z.cross(self.dir_x)
@@ -191,7 +191,7 @@ class Ellipse:
         """
         origin_to_point = point - self.origin
         dir_in_plane = UnitVector3D.from_points(
-            Point3D([0, 0, 0]), origin_to_point - ((origin_to_point * self.dir_z) * self.dir_z)
+            ZERO_POINT3D, origin_to_point - ((origin_to_point * self.dir_z) * self.dir_z)
         )
         if dir_in_plane.is_zero:
             return EllipseEvaluation(self, 0)
@@ -279,14 +279,14 @@ class Ellipse:
             New ellipse that is the transformed copy of the original ellipse.
         """
         new_point = self.origin.transform(matrix)
-        new_reference = self._reference.transform(matrix)
-        new_axis = self._axis.transform(matrix)
+        # Directions only pick up the rotational part of the matrix
+        new_reference, new_axis = np.dot([self._reference, self._axis], matrix[:3, :3].T)
         return Ellipse(
             new_point,
             self.major_radius,
             self.minor_radius,
-            UnitVector3D(new_reference[0:3]),
-            UnitVector3D(new_axis[0:3]),
+            UnitVector3D(new_reference),
+            UnitVector3D(new_axis),
         )
 
     def get_parameterization(self) -> Parameterization:
@@ -28,6 +28,7 @@ from beartype import beartype as check_input_types
 from beartype.typing import Union
 import numpy as np
 
+from ansys.geometry.core.math.constants import ZERO_VECTOR3D
 from ansys.geometry.core.math.matrix import Matrix44
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
@@ -112,11 +113,10 @@ class Line:
         Line
            New line that is the transformed copy of the original line.
         """
-        old_origin_4d = np.array([[self.origin[0]], [self.origin[1]], [self.origin[2]], [1]])
-        new_origin_4d = matrix * old_origin_4d
-        new_point = Point3D([new_origin_4d[0], new_origin_4d[1], new_origin_4d[2]])
-        new_axis = matrix * np.append(self._direction, 0)
-        return Line(new_point, UnitVector3D(new_axis[0:3]))
+        # Origin (w=1) and direction (w=0) as columns of a single product
+        old_4d = np.array([[*self.origin, 1], [*self._direction, 0]]).T
+        new_origin_4d, new_direction_4d = np.dot(matrix, old_4d).T
+        return Line(Point3D(new_origin_4d[:3]), UnitVector3D(new_direction_4d[:3]))
 
     def project_point(self, point: Point3D) -> "LineEvaluation":
         """
@@ -191,7 +191,7 @@ class Line:
         Parameterization
             Information about how the line is parameterized.
         """
-        return Parameterization(ParamForm.OPEN, ParamType.LINEAR, Interval(np.NINF, np.inf))
+        return Parameterization(ParamForm.OPEN, ParamType.LINEAR, Interval(-math.inf, math.inf))
 
 
 class LineEvaluation(CurveEvaluation):
@@ -262,7 +262,7 @@ class LineEvaluation(CurveEvaluation):
         Vector3D
             Second derivative of the evaluation, which is always ``Vector3D([0, 0, 0])``.
         """
-        return Vector3D([0, 0, 0])
+        return ZERO_VECTOR3D
 
     @cached_property
     def curvature(self) -> float:
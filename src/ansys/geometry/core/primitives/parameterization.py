@@ -22,10 +22,11 @@
 """Provides the parametrization-related classes."""
 
 from enum import Enum, unique
+import math
 
-from beartype import beartype as check_input_types
 import numpy as np
 
+from ansys.geometry.core.misc.checks import check_type
 from ansys.geometry.core.typing import Real
 
 
@@ -47,6 +48,8 @@ class ParamUV:
         v-parameter.
     """
 
+    __slots__ = ("_u", "_v")
+
     def __init__(self, u: Real, v: Real) -> None:
         """Initialize ``ParamUV`` class."""
         self._u = u
@@ -62,7 +65,6 @@ class ParamUV:
         """v-parameter."""
         return self._v
 
-    @check_input_types
     def __add__(self, other: "ParamUV") -> "ParamUV":
         """
         Add the u and v components of the other ParamUV to this ParamUV.
@@ -77,9 +79,10 @@ class ParamUV:
         ParamUV
             The sum of the parameters.
         """
+        if not isinstance(other, ParamUV):
+            return NotImplemented
         return ParamUV(self._u + other._u, self._v + other._v)
 
-    @check_input_types
     def __sub__(self, other: "ParamUV") -> "ParamUV":
         """
         Subtract the u and v components of the other ParamUV from this ParamUV.
@@ -94,9 +97,10 @@ class ParamUV:
         ParamUV
             The difference of the parameters.
         """
+        if not isinstance(other, ParamUV):
+            return NotImplemented
         return ParamUV(self._u - other._u, self._v - other._v)
 
-    @check_input_types
     def __mul__(self, other: "ParamUV") -> "ParamUV":
         """
         Multiplies the u and v components of this ParamUV by the other ParamUV.
@@ -111,9 +115,10 @@ class ParamUV:
         ParamUV
             The product of the parameters.
         """
+        if not isinstance(other, ParamUV):
+            return NotImplemented
         return ParamUV(self._u * other._u, self._v * other._v)
 
-    @check_input_types
     def __truediv__(self, other: "ParamUV") -> "ParamUV":
         """
         Divides the u and v components of this ParamUV by the other ParamUV.
@@ -128,6 +133,8 @@ class ParamUV:
         ParamUV
             The quotient of the parameters.
         """
+        if not isinstance(other, ParamUV):
+            return NotImplemented
         return ParamUV(self._u / other._u, self._v / other._v)
 
     def __repr__(self) -> str:
@@ -147,9 +154,12 @@ class Interval:
         End value of the interval.
     """
 
-    @check_input_types
+    __slots__ = ("_start", "_end")
+
     def __init__(self, start: Real, end: Real) -> None:
         """Initialize ``Interval`` class."""
+        check_type(start, (int, float, np.integer, np.floating))
+        check_type(end, (int, float, np.integer, np.floating))
         if end < start:
             raise ValueError("Start value must be less than end value")
 
@@ -175,7 +185,7 @@ class Interval:
         bool
             True if both ends of the interval are negative and positive infinity respectively.
         """
-        return np.isneginf(self.start) and np.isinf(self.end)
+        return self.start == -math.inf and self.end == math.inf
 
     def is_closed(self) -> bool:
         """
@@ -186,7 +196,7 @@ class Interval:
         bool
             True if neither bound of the interval is infinite.
         """
-        return self.start > np.NINF and self.end < np.inf
+        return self.start > -math.inf and self.end < math.inf
 
     def get_span(self) -> Real:
         """
@@ -240,9 +250,13 @@ class Parameterization:
         Interval of the parameterization.
     """
 
-    @check_input_types
+    __slots__ = ("_form", "_type", "_interval")
+
     def __init__(self, form: ParamForm, type: ParamType, interval: Interval) -> None:
         """Initialize ``Parameterization`` class."""
+        check_type(form, ParamForm)
+        check_type(type, ParamType)
+        check_type(interval, Interval)
         self._form = form
         self._type = type
         self._interval = interval
@@ -97,7 +97,7 @@ class Sphere:
         """X-direction of the sphere."""
         return self._reference
 
-    @property
+    @cached_property
     def dir_y(self) -> UnitVector3D:
         """Y-direction of the sphere."""
         return self.dir_z.cross(self.dir_x)
@@ -142,13 +142,13 @@ class Sphere:
             New sphere that is the transformed copy of the original sphere.
         """
         new_point = self.origin.transform(matrix)
-        new_reference = self._reference.transform(matrix)
-        new_axis = self._axis.transform(matrix)
+        # Directions only pick up the rotational part of the matrix
+        new_reference, new_axis = np.dot([self._reference, self._axis], matrix[:3, :3].T)
         return Sphere(
             new_point,
             self.radius,
-            UnitVector3D(new_reference[0:3]),
-            UnitVector3D(new_axis[0:3]),
+            UnitVector3D(new_reference),
+            UnitVector3D(new_axis),
         )
 
     def mirrored_copy(self) -> "Sphere":
@@ -196,7 +196,7 @@ class Sphere:
         x = origin_to_point.dot(self.dir_x)
         y = origin_to_point.dot(self.dir_y)
         z = origin_to_point.dot(self.dir_z)
-        if np.allclose((x * x + y * y + z * z), Point3D([0, 0, 0])):
+        if np.isclose(x * x + y * y + z * z, 0.0):
             return SphereEvaluation(self, ParamUV(0, np.pi / 2))
 
         u = np.arctan2(y, x)
@@ -109,7 +109,7 @@ class Torus:
         """X-direction of the torus."""
         return self._reference
 
-    @property
+    @cached_property
     def dir_y(self) -> UnitVector3D:
         """Y-direction of the torus."""
         return self.dir_z.cross(self.dir_x)
@@ -155,14 +155,14 @@ class Torus:
             New torus that is the transformed copy of the original torus.
         """
         new_point = self.origin.transform(matrix)
-        new_reference = self._reference.transform(matrix)
-        new_axis = self._axis.transform(matrix)
+        # Directions only pick up the rotational part of the matrix
+        new_reference, new_axis = np.dot([self._reference, self._axis], matrix[:3, :3].T)
         return Torus(
             new_point,
             self.major_radius,
             self.minor_radius,
-            UnitVector3D(new_reference[0:3]),
-            UnitVector3D(new_axis[0:3]),
+            UnitVector3D(new_reference),
+            UnitVector3D(new_axis),
         )
 
     def mirrored_copy(self) -> "Torus":
@@ -54,6 +54,7 @@ class ProblemArea:
         """Initialize a new instance of a problem area class."""
         self._id = id
         self._id_grpc = Int32Value(value=int(id))
+        self._grpc_client = grpc_client
         self._repair_stub = RepairToolsStub(grpc_client.channel)
 
     @property
@@ -61,6 +62,10 @@ class ProblemArea:
         """The id of the problem area."""
         return self._id
 
+    def _outdate_cache(self) -> None:
+        """Outdate the data cached by the faces, since a fix may modify any body."""
+        self._grpc_client._topology_version += 1
+
     @abstractmethod
     def fix(self):
         """Fix problem area."""
@@ -106,9 +111,13 @@ class DuplicateFaceProblemAreas(ProblemArea):
         message: RepairToolMessage
             Message containing created and/or modified bodies.
         """
-        response = self._repair_stub.FixDuplicateFaces(
-            FixDuplicateFacesRequest(duplicate_face_problem_area_id=self._id_grpc)
-        )
+        try:
+            response = self._repair_stub.FixDuplicateFaces(
+                FixDuplicateFacesRequest(duplicate_face_problem_area_id=self._id_grpc)
+            )
+        finally:
+            self._outdate_cache()
+
         message = RepairToolMessage(
             response.result.success,
             response.result.created_bodies_monikers,
@@ -150,9 +159,13 @@ class MissingFaceProblemAreas(ProblemArea):
         message: RepairToolMessage
             Message containing created and/or modified bodies.
         """
-        response = self._repair_stub.FixMissingFaces(
-            FixMissingFacesRequest(missing_face_problem_area_id=self._id_grpc)
-        )
+        try:
+            response = self._repair_stub.FixMissingFaces(
+                FixMissingFacesRequest(missing_face_problem_area_id=self._id_grpc)
+            )
+        finally:
+            self._outdate_cache()
+
         message = RepairToolMessage(
             response.result.success,
             response.result.created_bodies_monikers,
@@ -194,9 +207,13 @@ class InexactEdgeProblemAreas(ProblemArea):
         message: RepairToolMessage
             Message containing created and/or modified bodies.
         """
-        response = self._repair_stub.FixInexactEdges(
-            FixInexactEdgesRequest(inexact_edge_problem_area_id=self._id_grpc)
-        )
+        try:
+            response = self._repair_stub.FixInexactEdges(
+                FixInexactEdgesRequest(inexact_edge_problem_area_id=self._id_grpc)
+            )
+        finally:
+            self._outdate_cache()
+
         message = RepairToolMessage(
             response.result.success,
             response.result.created_bodies_monikers,
@@ -263,9 +280,13 @@ class SmallFaceProblemAreas(ProblemArea):
         message: RepairToolMessage
             Message containing created and/or modified bodies.
         """
-        response = self._repair_stub.FixSmallFaces(
-            FixSmallFacesRequest(small_face_problem_area_id=self._id_grpc)
-        )
+        try:
+            response = self._repair_stub.FixSmallFaces(
+                FixSmallFacesRequest(small_face_problem_area_id=self._id_grpc)
+            )
+        finally:
+            self._outdate_cache()
+
         message = RepairToolMessage(
             response.result.success,
             response.result.created_bodies_monikers,
@@ -307,9 +328,13 @@ class SplitEdgeProblemAreas(ProblemArea):
         message: RepairToolMessage
             Message containing created and/or modified bodies.
         """
-        response = self._repair_stub.FixSplitEdges(
-            FixSplitEdgesRequest(split_edge_problem_area_id=self._id_grpc)
-        )
+        try:
+            response = self._repair_stub.FixSplitEdges(
+                FixSplitEdgesRequest(split_edge_problem_area_id=self._id_grpc)
+            )
+        finally:
+            self._outdate_cache()
+
         message = RepairToolMessage(
             response.result.success,
             response.result.created_bodies_monikers,
@@ -351,9 +376,13 @@ class StitchFaceProblemAreas(ProblemArea):
         message: RepairToolMessage
             Message containing created and/or modified bodies.
         """
-        response = self._repair_stub.FixStitchFaces(
-            FixStitchFacesRequest(stitch_face_problem_area_id=self._id_grpc)
-        )
+        try:
+            response = self._repair_stub.FixStitchFaces(
+                FixStitchFacesRequest(stitch_face_problem_area_id=self._id_grpc)
+            )
+        finally:
+            self._outdate_cache()
+
         message = RepairToolMessage(
             response.result.success,
             response.result.created_bodies_monikers,
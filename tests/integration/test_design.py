@@ -334,6 +334,11 @@ def test_faces_edges(modeler: Modeler):
     # Get the central point of some of the surfaces
     assert faces[0].face_point(u=-0.03, v=-0.03) == Point3D([-30, -30, 0], UNITS.mm)
     assert faces[1].face_point(u=-0.03, v=-0.03) == Point3D([-30, -30, 30], UNITS.mm)
+    assert faces[0].face_points([(-0.03, -0.03), (-0.025, -0.03)]) == [
+        faces[0].face_point(u=-0.03, v=-0.03),
+        faces[0].face_point(u=-0.025, v=-0.03),
+    ]
+    assert faces[1].face_normals([(-0.03, -0.03)]) == [UNITVECTOR3D_Z]
 
     loops = faces[0].loops
     assert len(loops) == 1
@@ -349,6 +354,7 @@ def test_faces_edges(modeler: Modeler):
     assert all(edge.id is not None for edge in edges)
     assert all(edge.curve_type == CurveType.CURVETYPE_LINE for edge in edges)
     assert all(edge.length > 0.0 for edge in edges)
+    assert all(any(edge is loop_edge for loop_edge in loops[0].edges) for edge in edges)
     assert (
         abs(edges[0].length.to_base_units().m - sketch.faces[0].length.to_base_units().m) <= 1e-15
     )
@@ -360,6 +366,23 @@ def test_faces_edges(modeler: Modeler):
         [face.id == faces[0].id for face in faces_of_edge]
     )  # The bottom face must be one of them
 
+    # Server-side data is cached by the face until its body is modified
+    area = faces[0].area
+    assert faces[0].area is area
+    assert faces[0].loops[0] is loops[0]
+    assert faces[0]._get_area(cache=False) == area
+    body_polygon_comp.translate(UNITVECTOR3D_Z, Quantity(10, UNITS.mm))
+    assert faces[0].loops[0] is not loops[0]
+    assert faces[0].area == area
+
+    # ... also when the body is translated through its component
+    loops = faces[0].loops
+    body_polygon_comp.parent.translate_bodies(
+        [body_polygon_comp], UNITVECTOR3D_Z, Quantity(10, UNITS.mm)
+    )
+    assert faces[0].loops[0] is not loops[0]
+    assert np.isclose(faces[0].loops[0].min_bbox[2], loops[0].min_bbox[2] + 0.01)
+
 
 def test_coordinate_system_creation(modeler: Modeler):
     """Test for verifying the correct creation of ``CoordinateSystem``."""
@@ -927,11 +950,15 @@ def test_project_and_imprint_curves(modeler: Modeler, skip_not_on_linux_service)
     # Now once the previous curves have been projected, let's try imprinting our sketch
     #
     # It should generate two additional faces to our box = 6 + 2
-    _, new_faces = body.imprint_curves(faces=faces, sketch=imprint_sketch_2)
+    new_edges, new_faces = body.imprint_curves(faces=faces, sketch=imprint_sketch_2)
 
     assert len(new_faces) == 2
     assert len(body.faces) == 8
 
+    # Imprinted edges are the same objects the body hands out afterwards
+    body_edges = body.edges
+    assert all(any(edge is body_edge for body_edge in body_edges) for edge in new_edges)
+
     # Make sure we have occurrence faces, not master
     assert faces[0].id not in [face.id for face in body._template.faces]
     assert new_faces[0].id not in [face.id for face in body._template.faces]
@@ -0,0 +1,44 @@
+import signal
+
+import pytest
+
+from ansys.geometry.core import errors
+from ansys.geometry.core.errors import protect_grpc
+
+
+def test_protect_grpc_restores_handler_on_error():
+    """Test that the SIGINT handler is restored when the protected function raises."""
+    previous_handler = signal.getsignal(signal.SIGINT)
+
+    @protect_grpc
+    def failing_call():
+        assert signal.getsignal(signal.SIGINT) is errors.handler
+        raise ValueError("Failing call")
+
+    with pytest.raises(ValueError, match="Failing call"):
+        failing_call()
+
+    assert signal.getsignal(signal.SIGINT) is previous_handler
+    assert errors._CAPTURING_INTERRUPT is False
+
+
+def test_protect_grpc_nested_calls():
+    """Test that nested protected calls keep the handler installed by the outer call."""
+    previous_handler = signal.getsignal(signal.SIGINT)
+    observed = []
+
+    @protect_grpc
+    def inner_call():
+        observed.append((signal.getsignal(signal.SIGINT), errors._CAPTURING_INTERRUPT))
+        return 42
+
+    @protect_grpc
+    def outer_call():
+        result = inner_call()
+        observed.append((signal.getsignal(signal.SIGINT), errors._CAPTURING_INTERRUPT))
+        return result
+
+    assert outer_call() == 42
+    assert observed == [(errors.handler, True), (errors.handler, True)]
+    assert signal.getsignal(signal.SIGINT) is previous_handler
+    assert errors._CAPTURING_INTERRUPT is False
@@ -1,4 +1,3 @@
-from beartype.roar import BeartypeCallHintParamViolation
 import numpy as np
 import pytest
 
@@ -35,6 +34,11 @@ def test_param_uv():
     assert Accuracy.length_is_equal(quot.u, 1)
     assert Accuracy.length_is_equal(quot.v, 0.5)
 
+    with pytest.raises(TypeError):
+        p + 1
+    with pytest.raises(TypeError):
+        p * [1, 2]
+
 
 def test_interval():
     open_interval = Interval(np.NINF, np.inf)
@@ -64,6 +68,9 @@ def test_interval():
 
     assert closed_interval.get_span() == 2
 
+    with pytest.raises(TypeError):
+        Interval("a", 1)
+
 
 def test_param_form():
     open = ParamForm.OPEN
@@ -107,11 +114,11 @@ def test_parameterization():
     assert Accuracy.length_is_equal(p.interval.end, 2 * np.pi)
     assert p.interval.is_closed()
 
-    with pytest.raises(BeartypeCallHintParamViolation):
+    with pytest.raises(TypeError):
         Parameterization(ParamType.CIRCULAR, ParamType.OTHER, Interval(-1, 1))
 
-    with pytest.raises(BeartypeCallHintParamViolation):
+    with pytest.raises(TypeError):
         Parameterization(ParamForm.CLOSED, ParamForm.CLOSED, Interval(-1, 1))
 
-    with pytest.raises(BeartypeCallHintParamViolation):
+    with pytest.raises(TypeError):
         Parameterization(ParamForm.CLOSED, ParamType.OTHER, [-1, 1])
@@ -48,6 +48,7 @@ def test_cylinder():
     assert isinstance(c_1.radius, Quantity)
     assert np.allclose(c_1.dir_x, UNITVECTOR3D_X)
     assert np.allclose(c_1.dir_y, UNITVECTOR3D_Y)
+    assert c_1.dir_y is c_1.dir_y
     assert np.allclose(c_1.dir_z, UNITVECTOR3D_Z)
 
     assert Accuracy.length_is_equal(c_1.surface_area(1).m, 12.5663706)
@@ -82,6 +83,11 @@ def test_cylinder():
     assert np.allclose(cylinder_transformation._origin, Point3D([-99, 42, 13]))
     assert np.allclose(cylinder_transformation._reference, UnitVector3D([-31, 12, 99]))
     assert np.allclose(cylinder_transformation._axis, UnitVector3D([-99, 0, -31]))
+    translation_matrix = Matrix44([[1, 0, 0, 5], [0, 1, 0, 6], [0, 0, 1, 7], [0, 0, 0, 1]])
+    cylinder_translation = cylinder_2.transformed_copy(matrix=translation_matrix)
+    assert np.allclose(cylinder_translation._origin, Point3D([47, 105, 20]))
+    assert np.allclose(cylinder_translation._reference, cylinder_2._reference)
+    assert np.allclose(cylinder_translation._axis, cylinder_2._axis)
     cylinder_mirror = cylinder_2.mirrored_copy()
     assert np.allclose(cylinder_mirror._origin, Point3D([42, 99, 13]))
     assert np.allclose(